@@ -1,21 +1,23 @@
+import re
 import sys
 from collections import OrderedDict
+from functools import update_wrapper
 
 from makefun import wraps
 
 try:  # python 3+
-    from inspect import signature, Signature
+    from inspect import signature, Signature, Parameter
 except ImportError:
-    from funcsigs import signature, Signature
+    from funcsigs import signature, Signature, Parameter
 
 try:  # python 3.5+
-    from typing import Tuple, Callable, Union, Iterable
+    from typing import Tuple, Callable, Union, Iterable, Optional
 except ImportError:
     pass
 
 from decopatch import function_decorator, DECORATED
 
-from autoclass.utils import read_fields_from_init
+from autoclass.utils import read_fields_from_init, compile_function
 
 
 @function_decorator
@@ -79,6 +81,110 @@ def autoargs_decorate(func,          # type: Callable
     return _autoargs_decorate(func, func_sig, selected_names)
 
 
+# the name under which the decorated function is available to the generated wrapper
+_WRAPPED_NAME = '_autoargs_wrapped_'
+
+
+def _compile_autoargs_init(func,       # type: Callable
+                           func_sig,   # type: Signature
+                           att_names   # type: Iterable[str]
+                           ):
+    # type: (...) -> Optional[Callable]
+    """
+    Generates a wrapper around the function `func` with the same parameters, that sets all attributes in `att_names`
+    on its first argument and then calls `func`. For example with `def __init__(self, foo, debug=False)`:
+
+    ```
+    def __init__(self, foo, debug=_autoargs_default_2):
+        self.foo = foo
+        self.debug = debug
+        return _autoargs_wrapped_(self, foo, debug)
+    ```
+
+    This way the assignments are plain attribute stores and no binding of the arguments is needed at call time.
+    Signatures that can not be rewritten this way (no positional first argument, reserved name used) return None so
+    that the generic wrapper is used instead.
+
+    :param func:
+    :param func_sig:
+    :param att_names:
+    :return: the generated wrapper, or None
+    """
+    params = tuple(func_sig.parameters.values())
+    if len(params) == 0 or params[0].kind not in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD) \
+            or _WRAPPED_NAME in func_sig.parameters:
+        return None
+
+    fun_name = func.__name__
+    if not _is_identifier(fun_name):
+        fun_name = 'init_wrapper'
+
+    namespace = {_WRAPPED_NAME: func}
+    def_args = []
+    call_args = []
+    pos_only = False
+    kw_only = False
+    for i, p in enumerate(params):
+        name = p.name
+        # the '/' marker closes the positional-only parameters: write it before the first parameter of another kind
+        if p.kind is Parameter.POSITIONAL_ONLY:
+            pos_only = True
+        elif pos_only:
+            def_args.append('/')
+            pos_only = False
+
+        if p.kind is Parameter.VAR_POSITIONAL:
+            def_args.append('*' + name)
+            call_args.append('*' + name)
+            kw_only = True
+            continue
+        elif p.kind is Parameter.VAR_KEYWORD:
+            def_args.append('**' + name)
+            call_args.append('**' + name)
+            continue
+
+        if p.kind is Parameter.KEYWORD_ONLY:
+            if not kw_only:
+                def_args.append('*')
+                kw_only = True
+            call_args.append('%s=%s' % (name, name))
+        else:
+            call_args.append(name)
+
+        if p.default is Parameter.empty:
+            def_args.append(name)
+        else:
+            default_name = '_autoargs_default_%s' % i
+            namespace[default_name] = p.default
+            def_args.append('%s=%s' % (name, default_name))
+    if pos_only:
+        def_args.append('/')
+
+    self_name = params[0].name
+    body = ['    %s.%s = %s' % (self_name, att_name, att_name) for att_name in att_names]
+    body.append('    return %s(%s)' % (_WRAPPED_NAME, ', '.join(call_args)))
+    src = 'def %s(%s):\n%s\n' % (fun_name, ', '.join(def_args), '\n'.join(body))
+
+    init_fun = compile_function(src, fun_name, '<autoargs generated %s>' % fun_name, namespace)
+
+    # copy the name, docstring, annotations etc. so that the wrapper looks like `func`
+    update_wrapper(init_fun, func)
+    init_fun.__wrapped__ = func  # not set by update_wrapper in python 2
+    return init_fun
+
+
+def _is_identifier(name):
+    """ Returns True if `name` can be used as a function name in generated source code """
+    try:
+        return name.isidentifier()
+    except AttributeError:
+        # python 2
+        return bool(_IDENTIFIER_PATTERN.match(name))
+
+
+_IDENTIFIER_PATTERN = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_]*$')
+
+
 def _autoargs_decorate(func,       # type: Callable
                        func_sig,   # type: Signature
                        att_names   # type: Iterable[str]
@@ -87,11 +193,18 @@ def _autoargs_decorate(func,       # type: Callable
     Creates a wrapper around the function `func` so that all attributes in `att_names` are set to `self`
     BEFORE executing the function. The original function signature may be needed in some edge cases.
 
+    The wrapper is generated with the attribute names baked in when possible (see `_compile_autoargs_init`), otherwise
+    a generic wrapper is used.
+
     :param func:
     :param func_sig:
     :param att_names:
     :return:
     """
+    init_fun = _compile_autoargs_init(func, func_sig, att_names)
+    if init_fun is not None:
+        return init_fun
+
     @wraps(func)
     def init_wrapper(self, *args, **kwargs):
 
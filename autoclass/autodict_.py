@@ -434,6 +434,10 @@ def create_dict_methods_for_hardcoded_list(selected_names  # type: Union[Sized,
     :param selected_names:
     :return:
     """
+    # the names are iterated in order, and a set is used for the membership tests
+    selected_names = tuple(selected_names)
+    selected_names_set = frozenset(selected_names)
+
     def __iter__(self):
         """
         Generated by @autodict. Relies on the hardcoded list of fields to return the iterable of dict keys.
@@ -445,7 +449,7 @@ def create_dict_methods_for_hardcoded_list(selected_names  # type: Union[Sized,
         Generated by @autodict. Relies on the hardcoded list of fields to make sure the key is allowed,
         and then maps the "get" (dict) to "getattr" (object).
         """
-        if key not in selected_names:
+        if key not in selected_names_set:
             raise KeyError('@autodict generated dict view - invalid or hidden field name: %s' % key)
 
         try:
@@ -476,20 +480,24 @@ def create_dict_methods_for_hardcoded_list_and_super_mapping(cls,            # t
     :param selected_names:
     :return:
     """
+    # the names are iterated in order, and a set is used for the membership tests
+    selected_names = tuple(selected_names)
+    selected_names_set = frozenset(selected_names)
+
     def __iter__(self):
         """
         Generated by @autodict.
         Relies on the hardcoded list of fields PLUS the super keys to return the iterable of dict keys.
         """
         return chain(selected_names,
-                     (o for o in super(cls, self).__iter__() if o not in selected_names))
+                     (o for o in super(cls, self).__iter__() if o not in selected_names_set))
 
     def __getitem__(self, key):
         """
         Generated by @autodict. Relies on the hardcoded list of fields to make sure the key is allowed,
         and then maps the "get" (dict) to "getattr" (object) or super "get" (when not found).
         """
-        if key in selected_names:
+        if key in selected_names_set:
             try:
                 # map dict 'get' to object 'getattr'
                 return getattr(self, key)
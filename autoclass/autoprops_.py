@@ -1,13 +1,14 @@
 from copy import copy
-from inspect import getmembers
+from functools import update_wrapper
+from weakref import WeakKeyDictionary, WeakSet, ref
+from inspect import getmro, CO_VARARGS, CO_VARKEYWORDS
+from itertools import chain
 from warnings import warn
 
-from makefun import wraps, with_signature
-
 try:
-    from inspect import signature, Parameter, Signature
+    from inspect import Parameter, Signature
 except ImportError:
-    from funcsigs import signature, Parameter, Signature
+    from funcsigs import Parameter, Signature
 
 try:
     from typing import Any, Tuple, Callable, Union, TypeVar, Iterable, Dict
@@ -19,13 +20,35 @@ try:
 except ImportError:
     pass
 
+try:
+    # noinspection PyUnresolvedReferences
+    from contracts import ContractNotRespected, contract
+    WITH_PYCONTRACTS = True
+except ImportError:
+    WITH_PYCONTRACTS = False
+
+try:
+    # noinspection PyUnresolvedReferences
+    from valid8 import decorate_with_validators
+    WITH_VALID8 = True
+except ImportError:
+    WITH_VALID8 = False
+
 from decopatch import DECORATED, function_decorator, class_decorator
 
-from autoclass.utils import check_known_decorators, AUTO, read_fields_from_init, DuplicateOverrideError
+from autoclass.utils import check_known_decorators, read_fields_from_init, DuplicateOverrideError, \
+    get_signature, compile_function
 
 __GETTER_OVERRIDE_ANNOTATION = '__getter_override__'
 __SETTER_OVERRIDE_ANNOTATION = '__setter_override__'
 
+# the (constructor, include, exclude) with which each class was already processed by `autoprops_decorate`.
+# The constructor is stored as a weak reference so that the class can still be garbage-collected.
+_AUTOPROPS_DONE = WeakKeyDictionary()
+
+# all functions annotated by `autoprops_override_decorate`
+_OVERRIDE_FUNCS = WeakSet()
+
 
 class IllegalGetterSignatureException(Exception):
     """ This is raised whenever an overridden getter has an illegal signature"""
@@ -76,14 +99,28 @@ def autoprops_decorate(cls,           # type: Type[T]
     # first check that we do not conflict with other known decorators
     check_known_decorators(cls, '@autoprops')
 
-    # retrieve and filter the names
+    # if this class was already processed with the same constructor and arguments, there is nothing left to do
     init_fun = cls.__init__
+    done = _AUTOPROPS_DONE.get(cls, None)
+    if done is not None and any(init_ref() is init_fun and (inc, exc) == (include, exclude)
+                                for init_ref, inc, exc in done):
+        return cls
+
+    # retrieve and filter the names
     selected_names, init_fun_sig = read_fields_from_init(init_fun, include=include, exclude=exclude,
                                                          caller="@autoprops")
 
     # perform the class mod
     execute_autoprops_on_class(cls, init_fun=init_fun, init_fun_sig=init_fun_sig, prop_names=selected_names)
 
+    # remember it
+    try:
+        init_ref = ref(init_fun)
+    except TypeError:
+        pass  # not weak-referenceable (e.g. `object.__init__`): not remembered
+    else:
+        _AUTOPROPS_DONE.setdefault(cls, []).append((init_ref, include, exclude))
+
     return cls
 
 
@@ -104,110 +141,143 @@ def execute_autoprops_on_class(cls,            # type: Type[T]
     :return: nothing (`cls` is modified in-place)
     """
     # gather all information required: attribute names, type hints, and potential pycontracts/validators
-    att_type_hints_and_defaults = {att_name: (init_fun_sig.parameters[att_name].annotation,
-                                              init_fun_sig.parameters[att_name].default)
-                                   for att_name in prop_names}
-    pycontracts_dict = init_fun.__contracts__ if hasattr(init_fun, '__contracts__') else {}
-    valid8ors_dict = init_fun.__validators__ if hasattr(init_fun, '__validators__') else {}
+    params = init_fun_sig.parameters
+    att_type_hints_and_defaults = dict()
+    for att_name in prop_names:
+        p = params[att_name]
+        att_type_hints_and_defaults[att_name] = (p.annotation, p.default)
+    pycontracts_dict = getattr(init_fun, '__contracts__', None) or {}
+    valid8ors_dict = getattr(init_fun, '__validators__', None) or {}
 
     # 1. Retrieve overridden getters/setters and check that there is no one that does not correspond to an attribute
+    # note: we walk the class dictionaries along the mro rather than using `getmembers`, that would sort all names and
+    # `getattr` every member (including all the ones from `object`), triggering descriptors.
     overridden_getters = dict()
     overridden_setters = dict()
-    for m_name, m in getmembers(cls, predicate=callable):
-        # Overridden getter ?
-        try:
-            overriden_getter_att_name = getattr(m, __GETTER_OVERRIDE_ANNOTATION)
-        except AttributeError:
-            pass  # no annotation
-        else:
-            if overriden_getter_att_name not in att_type_hints_and_defaults:
-                raise AttributeError("Invalid getter function %r: attribute %r was not found in constructor "
-                                     "signature." % (m.__name__, overriden_getter_att_name))
-            elif overriden_getter_att_name in overridden_getters:
-                raise DuplicateOverrideError("Getter is overridden more than once for attribute name : %s"
-                                             % overriden_getter_att_name)
-            else:
-                overridden_getters[overriden_getter_att_name] = m
-
-        # Overridden setter ?
-        try:
-            overriden_setter_att_name = getattr(m, __SETTER_OVERRIDE_ANNOTATION)
-        except AttributeError:
-            pass  # no annotation
-        else:
-            if overriden_setter_att_name not in att_type_hints_and_defaults:
-                raise AttributeError("Invalid setter function %r: attribute %r was not found in constructor "
-                                     "signature." % (m.__name__, overriden_setter_att_name))
-            elif overriden_setter_att_name in overridden_setters:
-                raise DuplicateOverrideError("Setter is overridden more than once for attribute name : %s"
-                                             % overriden_setter_att_name)
-            else:
-                overridden_setters[overriden_setter_att_name] = m
-
-    # 2. For each attribute to consider, create the corresponding property and add it to the class
+    # note: this is skipped entirely when no override was ever declared (or all were garbage-collected)
+    if _OVERRIDE_FUNCS:
+        seen_names = set()
+        for _cls in getmro(cls):
+            if _cls is object:
+                continue
+            for m_name, m in vars(_cls).items():
+                # members redefined in a subclass hide the ones from the parent classes
+                if m_name in seen_names:
+                    continue
+                seen_names.add(m_name)
+                if not callable(m):
+                    continue
+
+                # Overridden getter ?
+                overriden_getter_att_name = getattr(m, __GETTER_OVERRIDE_ANNOTATION, None)
+                if overriden_getter_att_name is not None:
+                    if overriden_getter_att_name not in att_type_hints_and_defaults:
+                        raise AttributeError("Invalid getter function %r: attribute %r was not found in constructor "
+                                             "signature." % (m.__name__, overriden_getter_att_name))
+                    elif overriden_getter_att_name in overridden_getters:
+                        raise DuplicateOverrideError("Getter is overridden more than once for attribute name : %s"
+                                                     % overriden_getter_att_name)
+                    else:
+                        overridden_getters[overriden_getter_att_name] = m
+
+                # Overridden setter ?
+                overriden_setter_att_name = getattr(m, __SETTER_OVERRIDE_ANNOTATION, None)
+                if overriden_setter_att_name is not None:
+                    if overriden_setter_att_name not in att_type_hints_and_defaults:
+                        raise AttributeError("Invalid setter function %r: attribute %r was not found in constructor "
+                                             "signature." % (m.__name__, overriden_setter_att_name))
+                    elif overriden_setter_att_name in overridden_setters:
+                        raise DuplicateOverrideError("Setter is overridden more than once for attribute name : %s"
+                                                     % overriden_setter_att_name)
+                    else:
+                        overridden_setters[overriden_setter_att_name] = m
+
+    # 2. Compile all the accessors to generate at once
+    cls_module = cls.__module__
+    cls_qualname_prefix = cls.__name__ + '.'
+    generated_getters, generated_setters = _compile_generated_accessors(
+        getter_names=[n for n in att_type_hints_and_defaults if n not in overridden_getters],
+        setter_names=[n for n in att_type_hints_and_defaults if n not in overridden_setters],
+        cls_name=cls.__name__
+    )
+
+    # 3. For each attribute to consider, create the corresponding property
+    new_props = dict()
     for attr_name, (type_hint, default_value) in att_type_hints_and_defaults.items():
-        # valid8 validators: create copies, because we will modify them (changing the validated function ref)
-        if valid8ors_dict is not None and attr_name in valid8ors_dict:
-            validators = [copy(v) for v in valid8ors_dict[attr_name]]
-        else:
-            validators = None
-
-        # create and add the property
-        _add_property(cls, attr_name, type_hint, default_value,
-                      overridden_getter=overridden_getters.get(attr_name, None),
-                      overridden_setter=overridden_setters.get(attr_name, None),
-                      pycontract=pycontracts_dict.get(attr_name, None) if pycontracts_dict is not None else None,
-                      validators=validators)
-
-
-def _add_property(cls,                     # type: Type[T]
-                  property_name,           # type: str
-                  type_hint,               # type: Any
-                  default_value,           # type: Any
-                  overridden_getter=None,  # type: Callable
-                  overridden_setter=None,  # type: Callable
-                  pycontract=None,         # type: Any
-                  validators=None          # type: Any
-                  ):
+        # valid8 validators (copied by `_add_validators_to_setter`, only if they are actually used)
+        # an empty list is equivalent to no validators: in that case the setter is not wrapped at all
+        validators = valid8ors_dict.get(attr_name, None) or None
+
+        # create the property
+        new_props[attr_name] = _create_property(cls_module, cls_qualname_prefix, attr_name, type_hint, default_value,
+                                                overridden_getter=overridden_getters.get(attr_name, None),
+                                                overridden_setter=overridden_setters.get(attr_name, None),
+                                                generated_getter=generated_getters.get(attr_name, None),
+                                                generated_setter=generated_setters.get(attr_name, None),
+                                                pycontract=pycontracts_dict.get(attr_name, None),
+                                                validators=validators)
+
+    # 4. Finally add all properties to the class, once they are all created. Note: each setattr on a class invalidates
+    # the type attribute caches, so we do not want to interleave it with the introspection steps above.
+    for attr_name, new_prop in new_props.items():
+        setattr(cls, attr_name, new_prop)
+
+
+def _create_property(cls_module,              # type: str
+                     cls_qualname_prefix,     # type: str
+                     property_name,           # type: str
+                     type_hint,               # type: Any
+                     default_value,           # type: Any
+                     overridden_getter=None,  # type: Callable
+                     overridden_setter=None,  # type: Callable
+                     generated_getter=None,   # type: Callable
+                     generated_setter=None,   # type: Callable
+                     pycontract=None,         # type: Any
+                     validators=None          # type: Any
+                     ):
+    # type: (...) -> property
     """
-    A method to dynamically add a property to a class with the optional given pycontract or validators.
+    A method to dynamically create a property for a class with the optional given pycontract or validators.
     If the property getter and/or setter have been overridden, it is taken into account too.
+    Note that the property is not added to the class: this is the responsibility of the caller.
 
-    :param cls: the class on which to execute.
+    :param cls_module: the module of the class for which the property is created.
+    :param cls_qualname_prefix: the name of the class for which the property is created, followed by a dot.
     :param property_name:
     :param type_hint:
     :param default_value: this is not really needed by property setter/getter but may be used by type checkers to
         determine from the signature if something is nonable.
+    :param overridden_getter: the overridden getter to use, if any
+    :param overridden_setter: the overridden setter to use, if any
+    :param generated_getter: the generated getter to use when the getter is not overridden
+    :param generated_setter: the generated setter to use when the setter is not overridden
     :param pycontract:
     :param validators:
     :return:
     """
-    # 1. create the private field name , e.g. '_foobar'
-    private_property_name = '_%s' % property_name
+    # 1. property getter (@property) and setter (@property_name.setter) - generated or overridden
+    getter_fun = _get_getter_fun(property_name, type_hint, overridden_getter=overridden_getter,
+                                 generated_getter=generated_getter)
+    setter_fun, var_name = _get_setter_fun(property_name, type_hint, default_value,
+                                           overridden_setter=overridden_setter, generated_setter=generated_setter)
 
-    # 2. property getter (@property) and setter (@property_name.setter) - create or use overridden
-    getter_fun = _get_getter_fun(cls, property_name, type_hint, private_property_name,
-                                 overridden_getter=overridden_getter)
-    setter_fun, var_name = _get_setter_fun(cls, property_name, type_hint, default_value, private_property_name,
-                                           overridden_setter=overridden_setter)
-
-    # 3. add the contract to the setter, if any
+    # 2. add the contract to the setter, if any
     setter_fun_with_possible_contract = setter_fun
     if pycontract is not None:
         setter_fun_with_possible_contract = _add_contract_to_setter(setter_fun, var_name, pycontract, property_name)
     elif validators is not None:
         setter_fun_with_possible_contract = _add_validators_to_setter(setter_fun, var_name, validators, property_name)
 
-    # 4. change the function name to make it look nice
+    # 3. change the function name to make it look nice
     # TODO in which case is this really needed ?
     setter_fun_with_possible_contract.__name__ = property_name
-    setter_fun_with_possible_contract.__module__ = cls.__module__
-    setter_fun_with_possible_contract.__qualname__ = cls.__name__ + '.' + property_name
+    setter_fun_with_possible_contract.__module__ = cls_module
+    setter_fun_with_possible_contract.__qualname__ = cls_qualname_prefix + property_name
     # __annotations__
     # __doc__
     # __dict__
 
-    # 5. Create the property with getter and setter
+    # 4. Create the property with getter and setter
     # WARNING : property_obj.setter(f) does absolutely nothing :) > we have to assign the result
     new_prop = property(fget=getter_fun, fset=setter_fun_with_possible_contract)
 
@@ -217,47 +287,25 @@ def _add_property(cls,                     # type: Type[T]
     # DESIGN DECISION > although this would probably work, it is probably better to 'force' users to always use the
     # @autoprops annotation BEFORE any other annotation. This is now done in autoprops_decorate
 
-    # 6. Finally add the property to the class
-    setattr(cls, property_name, new_prop)
-
-
-def _has_annotation(annotation, value):
-    """
-    Returns a function that can be used as a predicate in getmembers. Used in _get_getter_fun and _get_setter_fun
-    """
-    def matches_property_name(fun):
-        """ return true if fun is a callable that has the correct annotation with value """
-        return callable(fun) and getattr(fun, annotation, None) == value
-
-    return matches_property_name
+    return new_prop
 
 
-def _get_getter_fun(cls,                    # type: Type
-                    property_name,          # type: str
-                    type_hint,              # type: Any
-                    private_property_name,  # type: str
-                    overridden_getter=AUTO  # type: Callable
+def _get_getter_fun(property_name,           # type: str
+                    type_hint,               # type: Any
+                    overridden_getter=None,  # type: Callable
+                    generated_getter=None    # type: Callable
                     ):
     """
-    Utility method to find the overridden getter function for a given property, or generate a new one
+    Utility method to check the overridden getter function for a given property, or generate a new one.
+    Overridden getters are collected once for the whole class in `execute_autoprops_on_class`, so the class is not
+    inspected again here.
 
-    :param cls:
     :param property_name:
     :param type_hint:
-    :param private_property_name:
+    :param overridden_getter: the overridden getter to use, or None if the generated getter should be used
+    :param generated_getter: the generated getter (see `_compile_generated_accessors`), used if not overridden
     :return:
     """
-    if overridden_getter is AUTO:
-        # If not provided - look for an overridden getter in the class
-        overridden_getters = getmembers(cls, predicate=_has_annotation(__GETTER_OVERRIDE_ANNOTATION, property_name))
-        if len(overridden_getters) > 1:
-            raise DuplicateOverrideError('Getter is overridden more than once for attribute name : %s' % property_name)
-        else:
-            try:
-                overridden_getter = overridden_getters[0][1]
-            except IndexError:
-                pass
-
     if overridden_getter is not None:
         # --use the overridden getter found/provided
         getter_fun = overridden_getter
@@ -267,60 +315,43 @@ def _get_getter_fun(cls,                    # type: Type
             pass
 
         # --check its signature
-        s = signature(getter_fun)
-        if not ('self' in s.parameters.keys() and len(s.parameters.keys()) == 1):
+        if _get_arg_names(getter_fun) != ('self',):
             raise IllegalGetterSignatureException("overridden getter '%s' should have 0 non-self arguments, found %s"
-                                                  % (getter_fun.__name__, s))
+                                                  % (getter_fun.__name__, get_signature(getter_fun)))
     else:
-        # -- generate the getter :
-        def autoprops_generated_getter(self):
-            """ generated by `autoprops` - getter for a property """
-            return getattr(self, private_property_name)
-
         # -- use the generated getter
-        getter_fun = autoprops_generated_getter
+        getter_fun = generated_getter
 
         # -- add type hint to output declaration
-        try:
-            annotations = getter_fun.__annotations__
-        except AttributeError:
-            pass  # python 2 - no return type hint
-        else:
-            annotations['return'] = type_hint
+        if type_hint is not Parameter.empty:
+            try:
+                annotations = getter_fun.__annotations__
+            except AttributeError:
+                pass  # python 2 - no return type hint
+            else:
+                annotations['return'] = type_hint
 
     return getter_fun
 
 
-def _get_setter_fun(cls,                    # type: Type
-                    property_name,          # type: str
-                    type_hint,              # type: Any
-                    default_value,          # type: Any
-                    private_property_name,  # type: str
-                    overridden_setter=AUTO  # type: Callable
+def _get_setter_fun(property_name,           # type: str
+                    type_hint,               # type: Any
+                    default_value,           # type: Any
+                    overridden_setter=None,  # type: Callable
+                    generated_setter=None    # type: Callable
                     ):
     """
-    Utility method to find the overridden setter function for a given property, or generate a new one
+    Utility method to check the overridden setter function for a given property, or generate a new one.
+    Overridden setters are collected once for the whole class in `execute_autoprops_on_class`, so the class is not
+    inspected again here.
 
-    :param cls:
     :param property_name:
     :param type_hint:
     :param default_value:
-    :param private_property_name:
-    :param overridden_setter: an already found overridden setter to use. If AUTO is provided (default), the class will
-        be inspected to find them
+    :param overridden_setter: the overridden setter to use, or None if the generated setter should be used
+    :param generated_setter: the generated setter (see `_compile_generated_accessors`), used if not overridden
     :return:
     """
-    if overridden_setter is AUTO:
-        # If not provided - look for an overridden setter in the class
-        overridden_setters = getmembers(cls, predicate=_has_annotation(__SETTER_OVERRIDE_ANNOTATION, property_name))
-        if len(overridden_setters) > 1:
-            raise DuplicateOverrideError('Setter is overridden more than once for attribute name : %s' % property_name)
-        else:
-            try:
-                overridden_setter = overridden_setters[0][1]
-            except IndexError:
-                pass
-
     if overridden_setter is not None:
         # --use the overridden setter found/provided
         setter_fun = overridden_setter
@@ -330,29 +361,101 @@ def _get_setter_fun(cls,                    # type: Type
             pass
 
         # --find the parameter name and check the signature
-        s = signature(setter_fun)
-        p = [attribute_name for attribute_name, param in s.parameters.items() if attribute_name is not 'self']
+        p = _get_arg_names(setter_fun)
+        if p and p[0] == 'self':
+            p = p[1:]
         if len(p) != 1:
             raise IllegalSetterSignatureException('overridden setter %s should have 1 and only 1 non-self argument, '
-                                                  'found %s' % (setter_fun.__name__, s))
+                                                  'found %s' % (setter_fun.__name__, get_signature(setter_fun)))
         actual_arg_name = p[0]
     else:
-        # --create the setter: Dynamically compile a wrapper with correct argument name
-        sig = Signature(parameters=[Parameter('self', kind=Parameter.POSITIONAL_OR_KEYWORD),
-                                    Parameter(property_name, kind=Parameter.POSITIONAL_OR_KEYWORD,
-                                              annotation=type_hint, default=default_value)])
-
-        @with_signature(sig)
-        def autoprops_generated_setter(self, **kwargs):
-            """ generated by `autoprops` - setter for a property """
-            setattr(self, private_property_name, kwargs[property_name])
-
-        setter_fun = autoprops_generated_setter
+        # --use the generated setter: it was compiled with the property name as argument name
+        setter_fun = generated_setter
         actual_arg_name = property_name
 
+        # -- add default value and type hint to the argument declaration
+        if default_value is not Parameter.empty:
+            setter_fun.__defaults__ = (default_value,)
+        if type_hint is not Parameter.empty:
+            try:
+                annotations = setter_fun.__annotations__
+            except AttributeError:
+                pass  # python 2 - no type hints
+            else:
+                annotations[property_name] = type_hint
+
     return setter_fun, actual_arg_name
 
 
+_GENERATED_GETTER_TEMPLATE = """
+    def autoprops_generated_getter(self):
+        \""" generated by `autoprops` - getter for a property \"""
+        return self.%(private_name)s
+    getters[%(name)r] = autoprops_generated_getter
+"""
+
+
+_GENERATED_SETTER_TEMPLATE = """
+    def autoprops_generated_setter(self, %(name)s):
+        \""" generated by `autoprops` - setter for a property \"""
+        self.%(private_name)s = %(name)s
+    setters[%(name)r] = autoprops_generated_setter
+"""
+
+
+def _compile_generated_accessors(getter_names,  # type: Iterable[str]
+                                 setter_names,  # type: Iterable[str]
+                                 cls_name       # type: str
+                                 ):
+    # type: (...) -> Tuple[Dict[str, Callable], Dict[str, Callable]]
+    """
+    Compiles the getter functions `autoprops_generated_getter(self)` returning `self._<name>` for all names in
+    `getter_names`, and the setter functions `autoprops_generated_setter(self, <name>)` storing their argument in
+    `self._<name>` for all names in `setter_names`.
+
+    The names are baked into the source, which leads to the same bytecode as handwritten accessors: no `getattr` or
+    `setattr` call, no keyword arguments dict and no wrapper layer. All accessors are defined in the body of a single
+    generated function, so that the compiler is invoked only once per class.
+
+    :param getter_names: the names of the properties for which a getter should be generated
+    :param setter_names: the names of the properties for which a setter should be generated
+    :param cls_name: the class name, only used in the pseudo file name of the generated code
+    :return: a tuple (getters, setters) of dictionaries containing the generated functions for each property name
+    """
+    body = ''.join([_GENERATED_GETTER_TEMPLATE % dict(name=n, private_name='_' + n) for n in getter_names]
+                   + [_GENERATED_SETTER_TEMPLATE % dict(name=n, private_name='_' + n) for n in setter_names])
+    getters, setters = dict(), dict()
+    if body:
+        define_accessors = compile_function('def define_accessors():%s' % body, 'define_accessors',
+                                            '<autoprops generated accessors for %s>' % cls_name,
+                                            namespace=dict(getters=getters, setters=setters))
+        define_accessors()
+
+        # the accessors look as if they were defined in this function
+        for f in chain(getters.values(), setters.values()):
+            f.__qualname__ = '_compile_generated_accessors.<locals>.%s' % f.__name__
+    return getters, setters
+
+
+def _get_arg_names(f  # type: Callable
+                   ):
+    # type: (...) -> Tuple[str, ...]
+    """
+    Returns the names of the arguments of function `f`. For plain functions they are read from the code object
+    directly, which is much faster than building the signature. Wrappers (exposing a `__wrapped__` or a `__signature__`)
+    and functions with variable or keyword-only arguments are inspected with `signature` instead.
+
+    :param f:
+    :return:
+    """
+    co = getattr(f, '__code__', None)
+    if co is None or (co.co_flags & (CO_VARARGS | CO_VARKEYWORDS)) or getattr(co, 'co_kwonlyargcount', 0) \
+            or hasattr(f, '__wrapped__') or hasattr(f, '__signature__'):
+        return tuple(get_signature(f).parameters)
+    else:
+        return co.co_varnames[:co.co_argcount]
+
+
 def _add_contract_to_setter(setter_fun, var_name, property_contract, property_name):
     """
     Utility function to add a pycontract contract to a setter
@@ -364,11 +467,8 @@ def _add_contract_to_setter(setter_fun, var_name, property_contract, property_na
     :return:
     """
 
-    # 0. check that we can import contracts
-    try:
-        # noinspection PyUnresolvedReferences
-        from contracts import ContractNotRespected, contract
-    except ImportError as e:
+    # 0. check that we could import contracts
+    if not WITH_PYCONTRACTS:
         raise Exception('Use of _add_contract_to_setter requires that PyContract library is installed. Check that you '
                         'can \'import contracts\'')
 
@@ -393,16 +493,26 @@ def _add_contract_to_setter(setter_fun, var_name, property_contract, property_na
     # -- add the generated contract
     setter_fun_with_possible_contract = contract(setter_fun, **{var_name: property_contract})
 
+    # pycontracts reports the setter's argument name in its error messages. Generated setters already use the property
+    # name as argument name so there is nothing to rewrite: return the contracted function directly, so that the
+    # nominal (no error) path does not pay for an extra wrapper.
+    if var_name != 'val' or property_name == 'val':
+        return setter_fun_with_possible_contract
+
     # the only thing we can't do is to replace the function's parameter name dynamically in the error messages
     # so we wrap the function again to catch the potential pycontracts error :(
-    @wraps(setter_fun_with_possible_contract)
-    def _contracts_parser_interceptor(self, *args, **kwargs):
+    # note: the overridden setter signature was checked to be (self, val), so a plain closure with the same signature
+    # is enough - there is no need to generate a signature-preserving wrapper. Its name is set by the caller.
+    def _contracts_parser_interceptor(self, val):
         try:
-            return setter_fun_with_possible_contract(self, *args, **kwargs)
+            return setter_fun_with_possible_contract(self, val)
         except ContractNotRespected as er:
             er.error = er.error.replace('\'val\'', '\'' + property_name + '\'')
             raise er
 
+    # copy the docstring, annotations, __dict__, etc. of the setter
+    update_wrapper(_contracts_parser_interceptor, setter_fun_with_possible_contract)
+    _contracts_parser_interceptor.__wrapped__ = setter_fun_with_possible_contract  # not set by update_wrapper in py2
     return _contracts_parser_interceptor
 
 
@@ -417,13 +527,10 @@ def _add_validators_to_setter(setter_fun, var_name, validators, property_name):
     :return:
     """
 
-    # 0. check that we can import valid8
-    try:
-        # noinspection PyUnresolvedReferences
-        from valid8 import decorate_with_validators
-    except ImportError:
-        raise Exception('Use of _add_contract_to_setter requires that valid8 library is installed. Check that you can'
-                        ' \'import valid8\'')
+    # 0. check that we could import valid8
+    if not WITH_VALID8:
+        raise Exception('Use of _add_validators_to_setter requires that valid8 library is installed. Check that you '
+                        'can \'import valid8\'')
 
     # -- check if a contract already exists on the function
     if hasattr(setter_fun, '__validators__'):
@@ -433,6 +540,9 @@ def _add_validators_to_setter(setter_fun, var_name, validators, property_name):
               'setter, please remove the one on the overridden setter.'
         warn(msg)
 
+    # -- create copies of the validators, because we will modify them (changing the validated function ref)
+    validators = [copy(v) for v in validators]
+
     # -- add the generated contract
     setter_fun_with_validation = decorate_with_validators(setter_fun, **{var_name: validators})
 
@@ -529,4 +639,7 @@ def autoprops_override_decorate(func,            # type: Callable
         # func.__getter_override__ = attribute
         setattr(func, __SETTER_OVERRIDE_ANNOTATION, attribute)
 
+    # (c) remember that there is at least one override to look for
+    _OVERRIDE_FUNCS.add(func)
+
     return func
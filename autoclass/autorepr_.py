@@ -2,13 +2,9 @@
 #
 #  Copyright (c) Schneider Electric Industries, 2019. All right reserved.
 
+from types import FunctionType
 from warnings import warn
 
-try:  # python 3+
-    from inspect import signature
-except ImportError:
-    from funcsigs import signature
-
 try:
     from typing import Any, Tuple, Union, Dict, TypeVar, Callable, Iterable, Sized
     try:
@@ -19,8 +15,8 @@ try:
 except ImportError:
     pass
 
-from autoclass.utils import is_attr_selected, method_already_there, check_known_decorators, read_fields, \
-    __AUTOCLASS_OVERRIDE_ANNOTATION, iterate_on_vars
+from autoclass.utils import check_known_decorators, read_fields, \
+    __AUTOCLASS_OVERRIDE_ANNOTATION, iterate_on_vars, compile_function, make_attr_selector
 
 from decopatch import class_decorator, DECORATED
 
@@ -129,87 +125,94 @@ def execute_autorepr_on_class(cls,                      # type: Type[T]
             raise ValueError("`selected_names` can not be used together with `include`, `exclude` or "
                              "`public_fields_only`")
 
-        str_repr_methods = create_repr_methods_for_hardcoded_list(selected_names, curly_mode=curly_string_repr)
+        str_method, repr_method = create_repr_methods_for_hardcoded_list(selected_names, curly_mode=curly_string_repr)
 
     else:
         # case (b) the list of fields is not predetermined, it will depend on vars(self)
         if include is None and exclude is None and not public_fields_only:
             # easy: all vars() are exposed
-            str_repr_methods = create_repr_methods_for_object_vars(curly_mode=curly_string_repr)
+            str_method, repr_method = create_repr_methods_for_object_vars(curly_mode=curly_string_repr)
         else:
             # harder: all fields are allowed, but there are filters on this dynamic list
             # private_name_prefix = '_' + object_type.__name__ + '_'
             private_name_prefix = '_' if public_fields_only else None
-            str_repr_methods = create_repr_methods_for_object_vars_with_filters(curly_mode=curly_string_repr,
-                                                                                include=include, exclude=exclude,
-                                                                                private_name_prefix=private_name_prefix)
-
-    if method_already_there(cls, '__str__', this_class_only=True):
-        if not hasattr(cls.__str__, __AUTOCLASS_OVERRIDE_ANNOTATION):
+            str_method, repr_method = create_repr_methods_for_object_vars_with_filters(
+                curly_mode=curly_string_repr, include=include, exclude=exclude, private_name_prefix=private_name_prefix
+            )
+
+    # note: the same function is used for both str and repr. The class dict is read once to know if they already exist
+    # (equivalent to `method_already_there(cls, <name>, this_class_only=True)`)
+    cls_dict = vars(cls)
+    if '__str__' in cls_dict:
+        if not hasattr(cls_dict['__str__'], __AUTOCLASS_OVERRIDE_ANNOTATION):
             warn('__str__ is already defined on class %s, it will be overridden with the one generated by '
                  '@autorepr/@autoclass ! If you want to use your version, annotate it with @autoclass_override'
                  % cls)
-            cls.__str__ = str_repr_methods.str
+            cls.__str__ = str_method
     else:
-        cls.__str__ = str_repr_methods.str
+        cls.__str__ = str_method
 
-    if method_already_there(cls, '__repr__', this_class_only=True):
-        if not hasattr(cls.__repr__, __AUTOCLASS_OVERRIDE_ANNOTATION):
+    if '__repr__' in cls_dict:
+        if not hasattr(cls_dict['__repr__'], __AUTOCLASS_OVERRIDE_ANNOTATION):
             warn('__repr__ is already defined on class %s, it will be overridden with the one generated by '
                  '@autorepr/@autoclass ! If you want to use your version, annotate it with @autoclass_override'
                  % cls)
-            cls.__repr__ = str_repr_methods.repr
+            cls.__repr__ = repr_method
     else:
-        cls.__repr__ = str_repr_methods.repr
-
-
-class ReprMethods(object):
-    """
-    Container used in @autodict to exchange the various methods created
-    """
-    __slots__ = 'str', 'repr'
-
-    def __init__(self, str, repr):
-        self.str = str
-        self.repr = repr
+        cls.__repr__ = repr_method
 
 
 def create_repr_methods_for_hardcoded_list(selected_names,  # type: Union[Sized, Iterable[str]]
                                            curly_mode       # type: bool
                                            ):
-    # type: (...) -> ReprMethods
+    # type: (...) -> Tuple[Callable, Callable]
     """
 
     :param selected_names:
     :param curly_mode:
-    :return:
+    :return: a tuple (str, repr) of the methods to use
     """
-    if not curly_mode:
-        def __repr__(self):
-            """
-            Generated by @autorepr. Relies on the hardcoded list of field names and "getattr" (object) for the value.
-            """
-            return '%s(%s)' % (self.__class__.__name__,
-                               ', '.join('%s=%r' % (k, getattr(self, k)) for k in selected_names))
+    selected_names = tuple(selected_names)
+    cache_key = (selected_names, bool(curly_mode))
+    try:
+        # a __repr__ was already compiled for the same list of names: only create a new function object from its code
+        ref_repr = _HARDCODED_REPRS[cache_key]
+    except KeyError:
+        # the format string and the tuple of attribute accesses are generated once, for this list of names
+        if not curly_mode:
+            template = '%%s(%s)' % ', '.join('%s=%%r' % k for k in selected_names)
+        else:
+            template = '%%s(**{%s})' % ', '.join('%r: %%r' % k for k in selected_names)
+        values = ''.join(' self.%s,' % k for k in selected_names)
 
+        src = _HARDCODED_REPR_TEMPLATE % dict(template=template, values=values)
+        __repr__ = _HARDCODED_REPRS[cache_key] = compile_function(src, '__repr__', '<autorepr generated __repr__>')
     else:
-        def __repr__(self):
-            """
-            Generated by @autorepr. Relies on the hardcoded list of field names and "getattr" (object) for the value.
-            """
-            return '%s(**{%s})' % (self.__class__.__name__,
-                                   ', '.join('%r: %r' % (k, getattr(self, k)) for k in selected_names))
+        __repr__ = FunctionType(ref_repr.__code__, ref_repr.__globals__, ref_repr.__name__)
+        __repr__.__qualname__ = ref_repr.__qualname__
 
-    return ReprMethods(str=__repr__, repr=__repr__)
+    return __repr__, __repr__
+
+
+# reference __repr__ functions already compiled, for each (selected_names, curly_mode)
+_HARDCODED_REPRS = dict()
+
+
+_HARDCODED_REPR_TEMPLATE = """def __repr__(self):
+    \"""
+    Generated by @autorepr. Relies on the hardcoded list of field names, compiled as attribute accesses.
+    \"""
+    return %(template)r %% (self.__class__.__name__,%(values)s)
+"""
 
 
 def create_repr_methods_for_object_vars(curly_mode       # type: bool
                                         ):
-    # type: (...) -> ReprMethods
+    # type: (...) -> Tuple[Callable, Callable]
     """
 
     :param curly_mode:
-    :return:
+    :return: a tuple (str, repr) of the methods to use
     """
     if not curly_mode:
         def __repr__(self):
@@ -227,7 +230,7 @@ def create_repr_methods_for_object_vars(curly_mode       # type: bool
             return '%s(**{%s})' % (self.__class__.__name__, ', '.join('%r: %r' % (k, getattr(self, k))
                                                                       for k in iterate_on_vars(self)))
 
-    return ReprMethods(str=__repr__, repr=__repr__)
+    return __repr__, __repr__
 
 
 def create_repr_methods_for_object_vars_with_filters(curly_mode,               # type: bool
@@ -235,16 +238,17 @@ def create_repr_methods_for_object_vars_with_filters(curly_mode,               #
                                                      exclude,                  # type: Union[str, Tuple[str]]
                                                      private_name_prefix=None  # type: str
                                                      ):
-    # type: (...) -> ReprMethods
+    # type: (...) -> Tuple[Callable, Callable]
     """
 
     :param curly_mode:
     :param include:
     :param exclude:
     :param private_name_prefix:
-    :return:
+    :return: a tuple (str, repr) of the methods to use
     """
-    public_fields_only = private_name_prefix is not None
+    # the filter on the name (include/exclude + private/public) is prepared once
+    is_selected = make_attr_selector(include=include, exclude=exclude, private_name_prefix=private_name_prefix)
 
     def _vars_iterator(self):
         """
@@ -254,9 +258,7 @@ def create_repr_methods_for_object_vars_with_filters(curly_mode,               #
         :return:
         """
         for att_name in iterate_on_vars(self):
-            # filter based on the name (include/exclude + private/public)
-            if is_attr_selected(att_name, include=include, exclude=exclude) and \
-                    (not public_fields_only or not att_name.startswith(private_name_prefix)):
+            if is_selected(att_name):
                 # use it
                 yield att_name, getattr(self, att_name)
 
@@ -275,4 +277,4 @@ def create_repr_methods_for_object_vars_with_filters(curly_mode,               #
             return '%s(**{%s})' % (self.__class__.__name__,
                                    ', '.join('%r: %r' % (k, v) for k, v in _vars_iterator(self)))
 
-    return ReprMethods(str=__repr__, repr=__repr__)
+    return __repr__, __repr__
@@ -7,14 +7,9 @@ import sys
 import types
 import warnings
 
-from autoclass.utils import check_known_decorators, read_fields, Source
+from autoclass.utils import check_known_decorators, read_fields, Source, compile_function
 from decopatch import class_decorator, DECORATED
 
-try:  # python 3+
-    from inspect import signature
-except ImportError:
-    from funcsigs import signature
-
 try:  # python 3.5+
     from typing import Union, Tuple, TypeVar
     try:  # python 3.5.3+
@@ -83,13 +78,16 @@ def autoslots_decorate(cls,                    # type: Type[C]
     selected_names, source = read_fields(cls, include=include, exclude=exclude, caller="@autoslots")
 
     # c. Collect the various items in the namespace of the class
-    cd = {k: v for k, v in cls.__dict__.items() if k not in ("__dict__", "__weakref__")}
+    cd = dict(cls.__dict__)
+    cd.pop("__dict__", None)
+    cd.pop("__weakref__", None)
 
     # Traverse the MRO to check for an existing __weakref__.
     weakref_inherited = False
-    base_names = []
+    base_names = set()
     for base_cls in cls.__mro__[1:-1]:
-        base_names += getattr(base_cls, "__slots__", ())
+        base_slots = getattr(base_cls, "__slots__", ())
+        base_names.update((base_slots,) if isinstance(base_slots, str) else base_slots)
         if "__weakref__" in  getattr(base_cls, "__dict__", ()):  # not needed: "in basename"
             weakref_inherited = True
             break
@@ -110,7 +108,9 @@ def autoslots_decorate(cls,                    # type: Type[C]
 
     # We only add the names of attributes that aren't inherited.
     # Settings __slots__ to inherited attributes wastes memory.
-    slot_names = [name for name in names if name not in base_names and name not in existing_cls_slots]
+    # note: sets are used for the membership tests, the order of `names` is preserved.
+    existing_cls_slots_set = set(existing_cls_slots)
+    slot_names = [name for name in names if name not in base_names and name not in existing_cls_slots_set]
     # add pre-existing slots from the class
     for es in existing_cls_slots:
         slot_names.append(es)
@@ -121,23 +121,15 @@ def autoslots_decorate(cls,                    # type: Type[C]
     # __getstate__/__setstate__ need to be overridden for pickle to continue working
     # see https://stackoverflow.com/questions/28665411/odd-behavior-with-slots-and-pickle
     # __weakref__ is not writable.
+    # They are compiled with the slot names baked in, so that they do not need to iterate on the names.
     state_attr_names = tuple(an for an in slot_names if an != "__weakref__")
-
-    def __getstate__(self):
-        """
-        Generated by @autoslots
-        """
-        return tuple(getattr(self, name) for name in state_attr_names)
-
-    def __setstate__(self, state):
-        """
-        Generated by @autoslots
-        """
-        for name, value in zip(state_attr_names, state):
-            setattr(self, name, value)
-
-    cd["__getstate__"] = __getstate__
-    cd["__setstate__"] = __setstate__
+    state = ''.join('self.%s, ' % an for an in state_attr_names)
+    cd["__getstate__"] = compile_function(_GETSTATE_TEMPLATE % dict(body='return (%s)' % state), '__getstate__',
+                                          '<autoslots generated __getstate__ for %s>' % cls.__name__)
+    cd["__setstate__"] = compile_function(_SETSTATE_TEMPLATE % dict(nb=len(state_attr_names),
+                                                                     body=('%s= state' % state) if state else 'pass'),
+                                          '__setstate__', '<autoslots generated __setstate__ for %s>' % cls.__name__,
+                                          namespace=dict(state_attr_names=state_attr_names))
 
     # Finally create the new class
     new_cls = type(cls)(cls.__name__, cls.__bases__, cd)
@@ -170,6 +162,26 @@ def autoslots_decorate(cls,                    # type: Type[C]
     return new_cls
 
 
+_GETSTATE_TEMPLATE = """def __getstate__(self):
+    \"""
+    Generated by @autoslots
+    \"""
+    %(body)s
+"""
+
+_SETSTATE_TEMPLATE = """def __setstate__(self, state):
+    \"""
+    Generated by @autoslots
+    \"""
+    if len(state) == %(nb)s:
+        %(body)s
+    else:
+        # a state of another length (e.g. pickled before a field was added or removed): set the ones that match
+        for name, value in zip(state_attr_names, state):
+            setattr(self, name, value)
+"""
+
+
 # ------------- code below shameously copied from https://github.com/python-attrs/attrs/blob/master/src/attr/_compat.py
 # so as to fix the bug in autoslots when super() is used.
 
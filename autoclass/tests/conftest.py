@@ -3,20 +3,39 @@ import pytest
 from setuptools_scm.git import GitWorkdir
 
 
+# the html tag factories and header cells used by the pytest-html hooks below, built once
+th = html.th
+td = html.td
+TEST_FILE_HEADER = th('Test File')
+TEST_HEADER = th('Test')
+DESCRIPTION_HEADER = th('Description')
+
+
+# whether an html report was requested (--html). Set once in `pytest_configure`
+_html_enabled = False
+
+
+def pytest_configure(config):
+    """ Detects once whether an html report is requested, so that the report hook can do nothing otherwise """
+    global _html_enabled
+    _html_enabled = bool(getattr(config.option, 'htmlpath', None))
+
+
 @pytest.mark.hookwrapper
 def pytest_runtest_makereport(item, call):
     """ adds the description field in the report, so that it may be used by the other two functions """
     outcome = yield
-    report = outcome.get_result()
-    report.description = str(item.function.__doc__)
+    if _html_enabled:
+        report = outcome.get_result()
+        report.description = str(item.function.__doc__)
 
 
 @pytest.mark.optionalhook
 def pytest_html_results_table_header(cells):
     """ Inserts the header for a 'description' column """
-    cells[1] = html.th('Test File')
-    cells.insert(2, html.th('Test'))
-    cells.insert(3, html.th('Description'))
+    cells[1] = TEST_FILE_HEADER
+    cells.insert(2, TEST_HEADER)
+    cells.insert(3, DESCRIPTION_HEADER)
     # cells.insert(0, html.th('Time', class_='sortable time', col='time'))
     # cells.pop()  keep it : we will link to codecov here
 
@@ -24,14 +43,13 @@ def pytest_html_results_table_header(cells):
 @pytest.mark.optionalhook
 def pytest_html_results_table_row(report, cells):
     """ Inserts the contents for the 'description' column : the docstring of the test function """
-    node_bits = report.nodeid.split('::')
-    file = node_bits[0]
-    test_id = node_bits[1:]
+    # 'file::test_id' - note: test_id may itself contain '::' (class::method), and is empty if there is no '::'
+    file, _, test_id = report.nodeid.partition('::')
     line = report.location[1]
 
-    cells[1] = html.th(file)
-    cells.insert(2, html.td('::'.join(test_id) if len(node_bits) > 1 else ''))
-    cells.insert(3, html.td(report.description))
+    cells[1] = th(file)
+    cells.insert(2, td(test_id))
+    cells.insert(3, td(report.description))
     # cells.insert(1, html.td(datetime.utcnow(), class_='col-time'))
     # cells.pop()
 
@@ -40,15 +58,31 @@ def pytest_html_results_table_row(report, cells):
     # if parsed_version is not None:
     #     hsh = parsed_version.node + ('' if not parsed_version.dirty else '-dirty')
 
-    try:
-        hsh = get_git_hash()
-        cells[-1] = html.td(html.a('source', href='https://codecov.io/gh/smarie/python-autoclass/src/' + hsh + '/'
+    hsh = get_git_hash()
+    if hsh is not None:
+        cells[-1] = td(html.a('source', href='https://codecov.io/gh/smarie/python-autoclass/src/' + hsh + '/'
                                                   + file + '#L' + str(line)))
-    except:
-        cells[-1] = html.td('could not read git version')
+    else:
+        cells[-1] = td('could not read git version')
+
+
+# the git hash, read only once per session (None if it could not be read)
+_NOT_READ = object()
+_git_hash = _NOT_READ
 
 
 def get_git_hash():
+    """ Returns the git hash of HEAD, or None if it can not be read. `git` is only called the first time. """
+    global _git_hash
+    if _git_hash is _NOT_READ:
+        try:
+            _git_hash = read_git_hash()
+        except Exception:
+            _git_hash = None
+    return _git_hash
+
+
+def read_git_hash():
     # works in local but not on travis
     # proc = subprocess.Popen('git rev-parse --verify --quiet HEAD', stdout=subprocess.PIPE)
     # tmp = proc.stdout.read()
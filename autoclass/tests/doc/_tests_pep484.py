@@ -11,6 +11,8 @@ from autoclass import setter_override, autoclass, AutoclassDecorationException,
 from valid8 import Boolean, ValidationError, validate_io
 from valid8.validation_lib import gts, between, minlen, gt
 
+from .test_readme_usage import check_readme_usage_autoclass
+
 
 def test_readme_pytypes():
     from pytypes import typechecked
@@ -233,22 +235,14 @@ def test_readme_usage_autoclass():
         def __init__(self, a: Integral, b: Boolean, c: Optional[List[str]] = None):
             pass
 
-    # instance creation
-    o = AllOfTheAbove(a=2, b=True)
-
-    # @autoargs works
-    assert o.a == 2
+    # @autoargs, @autoprops (with value validation) and @autodict work
+    o = check_readme_usage_autoclass(AllOfTheAbove)
 
     # @autoprops works, in combination with any runtime checker (here demonstrated with enforce)
     from enforce.exceptions import RuntimeTypeError
     with pytest.raises(RuntimeTypeError):
         o.b = 1  # RuntimeTypeError Argument 'b' was not of type Boolean. Actual type was int.
 
-    # @autodict works
-    assert o == {'a': 2, 'b': True, 'c': None}
-    assert AllOfTheAbove.from_dict(o) == o
-    assert dict(**o) == o
-
 
 def test_readme_usage_autoclass_custom():
     # we will use enforce as the runtime checker
@@ -264,22 +258,10 @@ def test_readme_usage_autoclass_custom():
         def __init__(self, a: Integral, b: Boolean, c: Optional[List[str]] = None):
             pass
 
-    # instance creation
-    o = PartsOfTheAbove(a=2, b=True)
-
-    # @autoargs works
-    assert o.a == 2
+    # @autoargs and @autoprops (with value validation) work, @autodict is disabled
+    o = check_readme_usage_autoclass(PartsOfTheAbove, autodict=False)
 
     # @autoprops works, in combination with any runtime checker (here demonstrated with enforce)
     from enforce.exceptions import RuntimeTypeError
     with pytest.raises(RuntimeTypeError):
         o.b = 1  # RuntimeTypeError Argument 'b' was not of type Boolean. Actual type was int.
-
-    # @autodict is disabled
-    with pytest.raises(AssertionError):
-        assert o == {'a': 2, 'b': True, 'c': None}  # AssertionError
-    with pytest.raises(AttributeError):
-        assert PartsOfTheAbove.from_dict(
-            o) == o  # AttributeError: type object 'PartsOfTheAbove' has no attribute 'from_dict'
-    with pytest.raises(TypeError):
-        assert dict(**o) == o  # TypeError: type object argument after ** must be a mapping, not PartsOfTheAbove
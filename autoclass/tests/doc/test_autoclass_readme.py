@@ -6,19 +6,18 @@ import sys
 import pytest
 
 
-# @pytest.mark.skipif(sys.version_info < (3, 0), reason="type hints do not work in python 2")
-@pytest.mark.skip(reason="Skipped until I understand why pytypes makes pytest.raises fail")
-def test_readme_pytypes():
-    """ Makes sure that the code in the documentation page is correct for the pytypes example """
+@pytest.mark.parametrize("checker", [
+    # pytest.param("pytypes", marks=pytest.mark.skipif(sys.version_info < (3, 0),
+    #                                                  reason="type hints do not work in python 2")),
+    pytest.param("pytypes", marks=pytest.mark.skip(reason="Skipped until I understand why pytypes makes "
+                                                          "pytest.raises fail")),
+    pytest.param("enforce", marks=[pytest.mark.skipif(sys.version_info < (3, 0),
+                                                      reason="type hints do not work in python 2"),
+                                   pytest.mark.skipif(sys.version_info >= (3, 7),
+                                                      reason="enforce does not work correctly under python 3.7+")]),
+])
+def test_readme(checker):
+    """ Makes sure that the code in the documentation page is correct for the pytypes and enforce examples """
 
-    from ._tests_pep484 import test_readme_pytypes
-    test_readme_pytypes()
-
-
-@pytest.mark.skipif(sys.version_info < (3, 0), reason="type hints do not work in python 2")
-@pytest.mark.skipif(sys.version_info >= (3, 7), reason="enforce does not work correctly under python 3.7+")
-def test_readme_enforce():
-    """ Makes sure that the code in the documentation page is correct for the enforce example """
-
-    from ._tests_pep484 import test_readme_enforce
-    test_readme_enforce()
+    from . import _tests_pep484
+    getattr(_tests_pep484, "test_readme_%s" % checker)()
@@ -7,10 +7,10 @@ try:
 except ImportError:
     pass
 from valid8 import validate_io, ValidationError
-from valid8.validation_lib import minlen
+from valid8.validation_lib import minlen, gt
 
 
-from autoclass import autoargs, autoprops, autodict, autohash
+from autoclass import autoargs, autoprops, autodict, autohash, autoclass
 
 
 def test_readme_usage_autoprops_validate():
@@ -207,3 +207,58 @@ def test_readme_usage_autoclass_custom():
 
     from ._tests_pep484 import test_readme_usage_autoclass_custom
     test_readme_usage_autoclass_custom()
+
+
+def check_readme_usage_autoclass(cls, autodict=True):
+    """ The checks shared by the @autoclass usage examples, with or without a runtime type checker. Returns the
+    instance created, so that the type checker-specific checks can be done on it """
+
+    # instance creation
+    o = cls(a=2, b=True)
+
+    # @autoargs works
+    assert o.a == 2
+
+    # @autoprops works, with value validation
+    with pytest.raises(ValidationError):
+        o.a = 0
+
+    if autodict:
+        # @autodict works
+        assert o == {'a': 2, 'b': True, 'c': None}
+        assert cls.from_dict(o) == o
+        assert dict(**o) == o
+    else:
+        # @autodict is disabled
+        assert o != {'a': 2, 'b': True, 'c': None}
+        with pytest.raises(AttributeError):
+            cls.from_dict(o)  # AttributeError: type object 'PartsOfTheAbove' has no attribute 'from_dict'
+        with pytest.raises(TypeError):
+            dict(**o)  # TypeError: type object argument after ** must be a mapping, not PartsOfTheAbove
+
+    return o
+
+
+def test_readme_usage_autoclass_no_type_checker():
+    """ Same as `test_readme_usage_autoclass` without the runtime type checker, so that it runs on all versions """
+
+    @autoclass
+    class AllOfTheAbove(object):
+        @validate_io(a=gt(1), c=minlen(1))
+        def __init__(self, a, b, c=None):
+            pass
+
+    check_readme_usage_autoclass(AllOfTheAbove)
+
+
+def test_readme_usage_autoclass_custom_no_type_checker():
+    """ Same as `test_readme_usage_autoclass_custom` without the runtime type checker, so that it runs on all versions
+    """
+
+    @autoclass(autodict=False)
+    class PartsOfTheAbove(object):
+        @validate_io(a=gt(1), c=minlen(1))
+        def __init__(self, a, b, c=None):
+            pass
+
+    check_readme_usage_autoclass(PartsOfTheAbove, autodict=False)
@@ -0,0 +1,32 @@
+#  Authors: Sylvain Marie <sylvain.marie@se.com>
+#
+#  Copyright (c) Schneider Electric Industries, 2019. All right reserved.
+import pytest
+
+from autoclass import autoargs
+
+
+def test_autoargs_kwonly():
+    """ @autoargs with keyword-only arguments, with and without *args """
+
+    class A(object):
+        @autoargs
+        def __init__(self, foo, *, bar, baz=[]):
+            pass
+
+    a = A('rhubarb', bar='pie')
+    assert a.foo == 'rhubarb'
+    assert a.bar == 'pie'
+    # the default value is not copied
+    assert a.baz is A.__init__.__kwdefaults__['baz']
+
+    with pytest.raises(TypeError):
+        A('rhubarb', 'pie')
+
+    class B(object):
+        @autoargs
+        def __init__(self, foo, *args, bar=1, **kw):
+            pass
+
+    b = B('rhubarb', 2, 3, bar=4, baz=5)
+    assert (b.foo, b.args, b.bar, b.kw) == ('rhubarb', (2, 3), 4, dict(baz=5))
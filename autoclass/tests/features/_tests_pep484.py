@@ -7,12 +7,16 @@ from autoclass import setter_override, autoclass, AutoclassDecorationException,
 from valid8 import Boolean, ValidationError, validate_io
 from valid8.validation_lib import gts, between, minlen, gt
 
+# all tests in this module use enforce: import it once (this module is only imported by the tests that need it)
+import enforce
+from enforce import runtime_validation
+from enforce.exceptions import RuntimeTypeError
+
 
 def test_autoclass_enforce_validate_not_reversed():
     """"""
 
-    from enforce import runtime_validation, config
-    config(dict(mode='covariant'))  # to accept subclasses in validation
+    enforce.config(dict(mode='covariant'))  # to accept subclasses in validation
 
     @runtime_validation
     @autoclass
@@ -32,8 +36,7 @@ def test_autoclass_enforce_validate_not_reversed():
 def test_autoclass_enforce_validate_reversed():
     """"""
 
-    from enforce import runtime_validation, config
-    config(dict(mode='covariant'))  # to accept subclasses in validation
+    enforce.config(dict(mode='covariant'))  # to accept subclasses in validation
 
     with pytest.raises(AutoclassDecorationException):
         @autoclass
@@ -48,15 +51,10 @@ def test_autoclass_enforce_validate_reversed():
                 print('Set surface to {}'.format(surface))
                 self._surface = surface
 
-        t = HouseConfiguration(12)
-
 
 def test_autoprops_enforce_validate():
 
-    import enforce as en
-    from enforce import runtime_validation
-
-    en.config(dict(mode='covariant'))  # allow subclasses when validating types
+    enforce.config(dict(mode='covariant'))  # allow subclasses when validating types
 
     @runtime_validation
     @autoprops
@@ -89,7 +87,6 @@ def test_autoprops_enforce_validate():
     assert t.toto == 'done'
 
     # Type validation works
-    from enforce.exceptions import RuntimeTypeError
     with pytest.raises(RuntimeTypeError):
         t.nb_floors = 2.2
 
@@ -99,8 +96,6 @@ def test_autoprops_enforce_validate():
 
 
 def test_autoprops_enforce_default():
-    from enforce import runtime_validation
-
     @runtime_validation
     @autoprops
     class Foo:
@@ -0,0 +1,37 @@
+#  Authors: Sylvain Marie <sylvain.marie@se.com>
+#
+#  Copyright (c) Schneider Electric Industries, 2019. All right reserved.
+import pytest
+
+from autoclass import autoargs
+
+
+def test_autoargs_posonly_varargs():
+    """ @autoargs with positional-only arguments followed by *args """
+
+    class A(object):
+        @autoargs
+        def __init__(self, foo, /, *args):
+            pass
+
+    a = A('rhubarb', 1, 2)
+    assert a.foo == 'rhubarb'
+    assert a.args == (1, 2)
+
+    with pytest.raises(TypeError):
+        A(foo='rhubarb')
+
+
+def test_autoargs_posonly_kwvarargs():
+    """ @autoargs with positional-only arguments followed by **kw """
+
+    class A(object):
+        @autoargs
+        def __init__(self, foo, bar=0, /, **kw):
+            pass
+
+    a = A('rhubarb', foo='pie')
+    assert a.foo == 'rhubarb'
+    assert a.bar == 0
+    # the positional-only names can still be used as keyword varargs
+    assert a.kw == dict(foo='pie')
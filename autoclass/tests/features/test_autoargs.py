@@ -195,3 +195,27 @@ def test_autoargs_no_double_set_default():
 
     Home(None, bar=True)
     assert counter == 1
+
+
+@pytest.mark.skipif(sys.version_info < (3, 0), reason="keyword-only arguments do not exist in python 2")
+def test_autoargs_kwonly():
+    """ @autoargs with keyword-only arguments """
+
+    from ._tests_pep3102 import test_autoargs_kwonly
+    test_autoargs_kwonly()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="positional-only arguments do not exist before python 3.8")
+def test_autoargs_posonly_varargs():
+    """ @autoargs with positional-only arguments followed by *args """
+
+    from ._tests_pep570 import test_autoargs_posonly_varargs
+    test_autoargs_posonly_varargs()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="positional-only arguments do not exist before python 3.8")
+def test_autoargs_posonly_kwvarargs():
+    """ @autoargs with positional-only arguments followed by **kw """
+
+    from ._tests_pep570 import test_autoargs_posonly_kwvarargs
+    test_autoargs_posonly_kwvarargs()
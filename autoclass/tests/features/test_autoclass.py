@@ -6,6 +6,8 @@ import sys
 import pytest
 import pickle
 
+from pyfields import field, autofields
+
 from autoclass import autoclass
 
 
@@ -89,7 +91,7 @@ def test_autoclass_slots():
             super(Bar, self).__init__(foo1, foo2)
             # pass
 
-    assert set(Bar.__slots__) == {'_bar'}
+    assert Bar.__slots__ == ('_bar',)
 
     a = Bar(2, 'th')
     assert a == {'bar': 2, 'foo1': 'th', 'foo2': 0}
@@ -103,8 +105,6 @@ def test_autoclass_slots():
 
 
 def test_autoclass_private():
-    from pyfields import autofields
-
     @autoclass
     @autofields
     class Example(object):
@@ -117,7 +117,6 @@ def test_autoclass_private():
 
 def test_autoclass_pyfields():
     """tests that @autoclass works with pyfields"""
-    from pyfields import field
 
     @autoclass(autodict=False)
     class Foo(object):
@@ -168,8 +167,6 @@ def test_autoclass_autopyfields():
 def test_autoclass_autopyfields_inherited():
     """tests that @autoclass works with pyfields in auto mode"""
 
-    from pyfields import autofields
-
     @autofields(make_init=False)
     class Bar(object):
         foo1 = None
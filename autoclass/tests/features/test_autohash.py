@@ -9,8 +9,12 @@ except ImportError:
 from autoclass import autohash, autoclass
 
 
-@pytest.mark.parametrize('only_public_fields', [True, False], ids=lambda x: 'only_public' if x else 'including class-private dunder fields')
-@pytest.mark.parametrize('only_constructor_args', [True, False], ids=lambda x: 'only_constructor_args' if x else 'all_obj_fields')
+@pytest.mark.parametrize('only_constructor_args, only_public_fields', [
+    # only_public_fields is not used when only_constructor_args is True
+    pytest.param(True, True, id='only_constructor_args'),
+    pytest.param(False, True, id='all_obj_fields-only_public'),
+    pytest.param(False, False, id='all_obj_fields-including class-private dunder fields'),
+])
 def test_autohash(only_constructor_args, only_public_fields):
     """ @autohash functionality with various customization options for only_constructor_args/only_public_fields """
 
@@ -39,8 +43,8 @@ def test_autohash(only_constructor_args, only_public_fields):
     a._new_field_weak_private = 2
     a.__new_field_class_private_incorrect = 3
 
-    class Dummy:
-        a.__new_field_class_private = 4
+    # set a class-private field as if from the body of another class `Dummy` (mangled with that class name)
+    setattr(a, '_Dummy__new_field_class_private', 4)
 
     # *** b is fully identical to a (constructor args + static/dynamic public/private fields)
     b = FooConfigA('rhubarb', ('pie', 'pie2'))
@@ -48,8 +52,7 @@ def test_autohash(only_constructor_args, only_public_fields):
     b._new_field_weak_private = 2
     b.__new_field_class_private_incorrect = 3
 
-    class Dummy:
-        b.__new_field_class_private = 4
+    setattr(b, '_Dummy__new_field_class_private', 4)
 
     # *** d is identical to a but only for constructor args + public fields
     d = FooConfigA('rhubarb', ('pie', 'pie2'))
@@ -59,8 +62,7 @@ def test_autohash(only_constructor_args, only_public_fields):
     d._new_field_weak_private = random()
     d.__new_field_class_private_incorrect = random()
 
-    class Dummy2:
-        d.__new_field_class_private = random()
+    setattr(d, '_Dummy2__new_field_class_private', random())
 
     # *** d is identical to a but only for constructor args
     e = FooConfigA('rhubarb', ('pie', 'pie2'))
@@ -68,27 +70,33 @@ def test_autohash(only_constructor_args, only_public_fields):
     # *** e is different from a
     f = FooConfigA('rhubarb', ('pie3', ''))
 
-    # check that the hash works
-    assert hash(a) == hash(b)
+    # check that the hash works (each hash is computed once)
+    ha, hb, hd, he, hf = hash(a), hash(b), hash(d), hash(e), hash(f)
+    assert ha == hb
 
     if only_constructor_args:
-        assert hash(a) == hash(d)
-        assert hash(a) == hash(e)
+        assert ha == hd
+        assert ha == he
     elif only_public_fields:
-        assert hash(a) == hash(d)
-        assert hash(a) != hash(e)
+        assert ha == hd
+        assert ha != he
     else:
-        assert hash(a) != hash(d)
-        assert hash(a) != hash(e)
+        assert ha != hd
+        assert ha != he
 
-    assert hash(a) != hash(f)
+    assert ha != hf
 
 
-def test_autohash_exclude():
+@pytest.mark.parametrize("decorators", [
+    # we have to put an underscore because that's the property
+    pytest.param((autoclass(autohash=False), autohash(exclude='bar')), id="autohash_exclude"),
+    # combined tests (foo is transformed to a property)
+    pytest.param((autoclass(include='foo'),), id="autoclass_include"),
+    pytest.param((autoclass(exclude='bar'),), id="autoclass_exclude"),
+])
+def test_autohash_exclude(decorators):
     """ Tests that exclusion works correctly with autohash """
 
-    @autoclass(autohash=False)
-    @autohash(exclude='bar')  # we have to put an underscore because that's the property
     class Foo(object):
         def __init__(self,
                      foo,  # type: str
@@ -96,32 +104,13 @@ def test_autohash_exclude():
                      ):
             pass
 
-    a = Foo('hello', dict())
-    assert hash(a) == hash((a.foo, ))  # supposed to work since we exclude the dict (unhashable)
-
-    # combined tests (foo is transformed to a property)
-    @autoclass(include='foo')
-    class Foo(object):
-        def __init__(self,
-                     foo,  # type: str
-                     bar  # type: Dict[str, str]
-                     ):
-            pass
+    # apply the decorators as if they were stacked on the class, innermost first
+    for d in reversed(decorators):
+        Foo = d(Foo)
 
     a = Foo('hello', dict())
     assert hash(a) == hash((a.foo, ))  # supposed to work since we exclude the dict (unhashable)
 
-    @autoclass(exclude='bar')
-    class Foo(object):
-        def __init__(self,
-                     foo,  # type: str
-                     bar  # type: Dict[str, str]
-                     ):
-            pass
-
-    a = Foo('hello', dict())
-    assert hash(a) == hash((a.foo,))  # supposed to work since we exclude the dict (unhashable)
-
 
 @pytest.mark.parametrize("only_known_fields", [False, True], ids="only_known_fields={}".format)
 def test_autohash_pyfields(only_known_fields):
@@ -10,6 +10,13 @@ from autoclass import autoargs, autoprops, getter_override, setter_override, \
     IllegalSetterSignatureException, DuplicateOverrideError, autoprops_decorate
 
 
+@pytest.fixture(scope="module")
+def contracts():
+    """ The PyContracts module, imported once for all tests of this module. An import error is reported as an error """
+    import contracts
+    return contracts
+
+
 def test_autoprops_no_contract():
     """ Basic @autoprops functionality, no customization - all constructor arguments become properties """
 
@@ -32,18 +39,16 @@ def test_autoprops_no_contract():
     assert t.b[0] == 'r'
 
 
-def test_autoprops_pycontracts():
+def test_autoprops_pycontracts(contracts):
     """
     @autopropsBasic functionality with PyContracts - if a `@contract` annotation exist on the `__init__` method,
     mentioning a contract for a given parameter, the parameter contract will be added on the generated setter method
     """
 
-    from contracts import ContractNotRespected, contract
-
     @autoprops
     class FooConfigA(object):
         @autoargs
-        @contract(a='str[>0]', b='list[>0](str[>0])')
+        @contracts.contract(a='str[>0]', b='list[>0](str[>0])')
         def __init__(self,
                      a,  # type: str
                      b  # type: List[str]
@@ -53,9 +58,9 @@ def test_autoprops_pycontracts():
     t = FooConfigA('rhubarb', ['pie', 'pie2'])
 
     # check that there are contracts on the generated setters
-    with pytest.raises(ContractNotRespected):
+    with pytest.raises(contracts.ContractNotRespected):
         t.a = ''
-    with pytest.raises(ContractNotRespected):
+    with pytest.raises(contracts.ContractNotRespected):
         t.b = ['r', '']
 
     # check that the generated getters work
@@ -63,15 +68,13 @@ def test_autoprops_pycontracts():
     assert t.b[0] == 'r'
 
 
-def test_autoprops_include():
+def test_autoprops_include(contracts):
     """ @autoprops With pycontracts and explicit list of attributes to include """
 
-    from contracts import ContractNotRespected, contract
-
     @autoprops(include='a')
     class FooConfigB(object):
         @autoargs
-        @contract(a='str[>0]', b='list[>0](str[>0])')
+        @contracts.contract(a='str[>0]', b='list[>0](str[>0])')
         def __init__(self,
                      a,  # type: str
                      b  # type: List[str]
@@ -81,7 +84,7 @@ def test_autoprops_include():
     t = FooConfigB('rhubarb', ['pie', 'pie2'])
 
     # check that there is a contract on the generated setter
-    with pytest.raises(ContractNotRespected):
+    with pytest.raises(contracts.ContractNotRespected):
         t.a = ''
 
     # check that no setter was generated for 'b'
@@ -89,15 +92,13 @@ def test_autoprops_include():
     assert t.b[0] == ''
 
 
-def test_autoprops_exclude():
+def test_autoprops_exclude(contracts):
     """ @autoprops With pycontracts and explicit list of attributes to exclude """
 
-    from contracts import ContractNotRespected, contract
-
     @autoprops(exclude='b')
     class FooConfigB(object):
         @autoargs
-        @contract(a='str[>0]', b='list[>0](str[>0])')
+        @contracts.contract(a='str[>0]', b='list[>0](str[>0])')
         def __init__(self,
                      a,  # type: str
                      b  # type: List[str]
@@ -107,7 +108,7 @@ def test_autoprops_exclude():
     t = FooConfigB('rhubarb', ['pie', 'pie2'])
 
     # check that there is a contract on the generated setter
-    with pytest.raises(ContractNotRespected):
+    with pytest.raises(contracts.ContractNotRespected):
         t.a = ''
 
     # check that no setter was generated for 'b'
@@ -125,17 +126,15 @@ def test_autoprops_include_exclude():
             pass
 
 
-def test_autoprops_override():
+def test_autoprops_override(contracts):
     """ @autoprops With Pycontracts. Tests that the user may override generated getter and a setter """
 
-    from contracts import ContractNotRespected, contract
-
     # check that there is a double-contract warning
     with pytest.warns(UserWarning):
         @autoprops
         class FooConfigC(object):
             @autoargs
-            @contract(a='str[>0]', b='list[>0](str[>0])')
+            @contracts.contract(a='str[>0]', b='list[>0](str[>0])')
             def __init__(self,
                          a,  # type: str
                          b  # type: List[str]
@@ -149,7 +148,7 @@ def test_autoprops_override():
                 return self._a
 
             @setter_override(attribute='b')
-            @contract(toto='list[>0](str[>0])')
+            @contracts.contract(toto='list[>0](str[>0])')
             def another_name(self,
                              toto  # type: List[str]
                              ):
@@ -163,11 +162,11 @@ def test_autoprops_override():
         assert t.a == 'rhubarb'
 
         # check that 'a' still has a contract on its setter
-        with pytest.raises(ContractNotRespected):
+        with pytest.raises(contracts.ContractNotRespected):
             t.a = ''
 
         # check that 'b' still has a contract on its setter
-        with pytest.raises(ContractNotRespected):
+        with pytest.raises(contracts.ContractNotRespected):
             t.b = ['']  # we can not
 
         # check that 'b' still has a getter generated
@@ -232,16 +231,95 @@ def test_autoprops_override_exceptions():
                 return self._b
 
 
-def test_autoprops_manual():
-    """ @autoprops Tests the manual wrapper autoprops() """
+def test_autoprops_override_inherited():
+    """ @autoprops Checks that overridden getters/setters defined in a parent class are taken into account """
+
+    class Base(object):
+        @getter_override(attribute='a')
+        def get_a(self):
+            return 'base_' + self._a
+
+    @autoprops
+    class FooConfigG(Base):
+        @autoargs
+        def __init__(self, a):
+            pass
+
+        def get_a(self):
+            """ redefined in the subclass without annotation: hides the parent's overridden getter """
+            return 'sub_' + self._a
+
+    @autoprops
+    class FooConfigH(Base):
+        @autoargs
+        def __init__(self, a):
+            pass
+
+    assert FooConfigG('hello').a == 'hello'
+    assert FooConfigH('hello').a == 'base_hello'
+
+
+def test_autoprops_decorate_twice():
+    """ @autoprops Checks that decorating a class twice with the same arguments does not create the properties again """
+
+    @autoprops
+    class FooConfigI(object):
+        @autoargs
+        def __init__(self, a, b):
+            pass
+
+    prop_a = FooConfigI.a
+    assert autoprops_decorate(FooConfigI) is FooConfigI
+    assert FooConfigI.a is prop_a
+
+    # a different selection is still processed
+    autoprops_decorate(FooConfigI, include='a')
+    assert FooConfigI.a is not prop_a
+    assert FooConfigI('hello', 1).a == 'hello'
+
+    # a new constructor is processed too
+    @autoargs
+    def __init__(self, a, b, c):
+        pass
+
+    FooConfigI.__init__ = __init__
+    autoprops_decorate(FooConfigI)
+    assert isinstance(FooConfigI.c, property)
+    assert FooConfigI('hello', 1, 2).c == 2
+
+
+def test_autoprops_no_init():
+    """ @autoprops Checks that a class without its own constructor (`object.__init__`) can be decorated, twice """
+
+    @autoprops
+    class FooConfigN(object):
+        pass
 
-    from contracts import ContractNotRespected
-    from contracts import contract
+    assert autoprops_decorate(FooConfigN) is FooConfigN
+    FooConfigN()
+
+
+@pytest.mark.skipif(sys.version_info < (3, 0), reason="function annotations do not exist in python 2")
+def test_autoprops_no_type_hint():
+    """ @autoprops Checks that no annotation is set on the generated accessors when there is no type hint """
+
+    @autoprops
+    class FooConfigJ(object):
+        @autoargs
+        def __init__(self, a):
+            pass
+
+    assert FooConfigJ.a.fget.__annotations__ == {}
+    assert FooConfigJ.a.fset.__annotations__ == {}
+
+
+def test_autoprops_manual(contracts):
+    """ @autoprops Tests the manual wrapper autoprops() """
 
     # we don't use @autoprops here
     class FooConfigA(object):
         @autoargs
-        @contract(a='str[>0]', b='list[>0](str[>0])')
+        @contracts.contract(a='str[>0]', b='list[>0](str[>0])')
         def __init__(self,
                      a,  # type: str
                      b  # type: List[str]
@@ -254,9 +332,9 @@ def test_autoprops_manual():
     t = FooConfigA('rhubarb', ['pie', 'pie2'])
 
     # check that there are contracts on the generated setters
-    with pytest.raises(ContractNotRespected):
+    with pytest.raises(contracts.ContractNotRespected):
         t.a = ''
-    with pytest.raises(ContractNotRespected):
+    with pytest.raises(contracts.ContractNotRespected):
         t.b = ['r', '']
 
     # check that the generated getters work
@@ -5,22 +5,59 @@ import sys
 
 import pytest
 
+from pyfields import field
+
 from autoclass import autorepr
 
 
+def format_pairs_curly(cls, pairs):
+    return "%s(**{%s})" % (cls.__name__, ", ".join(["%r: %r" % pair for pair in pairs]))
+
+
+def format_pairs_plain(cls, pairs):
+    return "%s(%s)" % (cls.__name__, ", ".join(["%s=%r" % pair for pair in pairs]))
+
+
+# the expected (name, value) pairs in the repr of `test_autorepr`
+PAIRS_KNOWN = (('a', 'rhubarb'),  # only the two constructor fields appear
+               ('b', ['pie', 'pie2']))
+
+PAIRS_PUBLIC = (('a', 'rhubarb'),
+                ('b', ['pie', 'pie2']),
+                ('c', 't'),
+                # _FooConfigA__class_private should not appear
+                ('new_field', 0)
+                #'_weak_private': 'r',
+                #'_new_field_weak_private': 1,
+                # private fields defined out of the objects class are still visible
+                #'__new_field_class_private_incorrect': 0,
+                #'_Dummy__new_field_class_private': 1
+                )
+
+PAIRS_ALL = (('a', 'rhubarb'),
+             ('b', ['pie', 'pie2']),
+             ('c', 't'),
+             ('_weak_private', 'r'),
+             ('_FooConfigA__class_private', 't'),  # <= this is the one private field that appears now
+             ('new_field', 0),
+             ('_new_field_weak_private', 1),
+             # private fields defined out of the objects class are still visible
+             ('__new_field_class_private_incorrect', 0),
+             ('_Dummy__new_field_class_private', 1))
+
+
 @pytest.mark.skipif(sys.version_info < (3, 6), reason="class vars order is not preserved")
-@pytest.mark.parametrize('only_public_fields', [True, False], ids=lambda x: 'only_public' if x else 'including class-private dunder fields')
-@pytest.mark.parametrize('only_known_fields', [True, False], ids=lambda x: 'only_constructor_args' if x else 'all_obj_fields')
 @pytest.mark.parametrize("curly_mode", [False, True], ids="curly_mode={}".format)
-def test_autorepr(only_known_fields, only_public_fields, curly_mode):
+@pytest.mark.parametrize('only_known_fields, only_public_fields, pairs', [
+    # only_public_fields is not used when only_known_fields is True
+    pytest.param(True, True, PAIRS_KNOWN, id='only_constructor_args'),
+    pytest.param(False, True, PAIRS_PUBLIC, id='all_obj_fields-only_public'),
+    pytest.param(False, False, PAIRS_ALL, id='all_obj_fields-including class-private dunder fields'),
+])
+def test_autorepr(only_known_fields, only_public_fields, pairs, curly_mode):
     """ @autorepr functionality with various customization options for only_constructor_args/only_public_fields """
 
-    if curly_mode:
-        def format_pairs(cls, pairs):
-            return "%s(**{%s})" % (cls.__name__, ", ".join(["%r: %r" % pair for pair in pairs]))
-    else:
-        def format_pairs(cls, pairs):
-            return "%s(%s)" % (cls.__name__, ", ".join(["%s=%r" % pair for pair in pairs]))
+    format_pairs = format_pairs_curly if curly_mode else format_pairs_plain
 
     @autorepr(only_known_fields=only_known_fields, only_public_fields=only_public_fields, curly_string_repr=curly_mode)
     class FooConfigA(object):
@@ -46,39 +83,11 @@ def test_autorepr(only_known_fields, only_public_fields, curly_mode):
     t._new_field_weak_private = 1
     t.__new_field_class_private_incorrect = 0
 
-    class Dummy:
-        t.__new_field_class_private = 1
+    # set a class-private field as if from the body of another class `Dummy` (mangled with that class name)
+    setattr(t, '_Dummy__new_field_class_private', 1)
 
     # check the str/repr
     assert str(t) == repr(t)
-
-    if only_known_fields:
-        pairs = [('a', 'rhubarb'),  # only the two constructor fields appear
-                 ('b', ['pie', 'pie2'])]
-    elif only_public_fields:
-        pairs = [('a', 'rhubarb'),
-                 ('b', ['pie', 'pie2']),
-                 ('c', 't'),
-                 # _FooConfigA__class_private should not appear
-                 ('new_field', 0)
-                 #'_weak_private': 'r',
-                 #'_new_field_weak_private': 1,
-                 # private fields defined out of the objects class are still visible
-                 #'__new_field_class_private_incorrect': 0,
-                 #'_Dummy__new_field_class_private': 1
-                 ]
-    else:
-        pairs = [('a', 'rhubarb'),
-                 ('b', ['pie', 'pie2']),
-                 ('c', 't'),
-                 ('_weak_private', 'r'),
-                 ('_FooConfigA__class_private', 't'),  # <= this is the one private field that appears now
-                 ('new_field', 0),
-                 ('_new_field_weak_private', 1),
-                 # private fields defined out of the objects class are still visible
-                 ('__new_field_class_private_incorrect', 0),
-                 ('_Dummy__new_field_class_private', 1)]
-
     assert str(t) == format_pairs(FooConfigA, pairs)
 
 
@@ -86,8 +95,6 @@ def test_autorepr(only_known_fields, only_public_fields, curly_mode):
 def test_autorepr_pyfields(curly_mode):
     """tests that @autorepr works with pyfields"""
 
-    from pyfields import field
-
     @autorepr
     class Foo(object):
         foo1 = field()
@@ -107,3 +114,17 @@ def test_autorepr_pyfields(curly_mode):
         assert str(a) == "Bar(**{'foo1': 'th', 'foo2': 0, 'bar': 2})"
     else:
         assert str(a) == "Bar(foo1='th', foo2=0, bar=2)"
+
+
+def test_autorepr_exclude_str():
+    """ @autorepr on object vars: a string `exclude` has the same meaning than in the other decorators """
+
+    @autorepr(only_known_fields=False, exclude='bar')
+    class Foo(object):
+        def __init__(self, ba, bar, c):
+            self.ba = ba
+            self.bar = bar
+            self.c = c
+
+    # as in is_attr_selected, a string is used as is: 'ba' is a substring of 'bar' and is excluded too
+    assert str(Foo(1, 2, 3)) == "Foo(c=3)"
@@ -30,9 +30,9 @@ def test_autoslots(use_public_names, add_weakref_slot, preexisting):
                 self._foo2 = foo2
 
     if use_public_names:
-        assert set(Foo.__slots__) == set(('foo1', 'foo2') + (('__weakref__',) if add_weakref_slot else ()))
+        assert sorted(Foo.__slots__) == sorted(('foo1', 'foo2') + (('__weakref__',) if add_weakref_slot else ()))
     else:
-        assert set(Foo.__slots__) == set(('_foo1', '_foo2') + (('__weakref__',) if add_weakref_slot else ()))
+        assert sorted(Foo.__slots__) == sorted(('_foo1', '_foo2') + (('__weakref__',) if add_weakref_slot else ()))
 
     f = Foo(1)
     assert not hasattr(f, '__dict__')
@@ -62,3 +62,24 @@ def test_autoslots_args_props():
     assert not hasattr(f, '__dict__')
     assert f.foo1 == 1
     assert f.foo2 == 0
+
+
+def test_autoslots_setstate_other_length():
+    """ Checks that a state with fewer or more values than slots (e.g. an older pickle) is still loaded """
+
+    @autoslots
+    class Foo(object):
+        def __init__(self, a, b):
+            self.a = a
+            self.b = b
+
+    f = Foo(1, 2)
+    assert f.__getstate__() == (1, 2)
+
+    g = Foo.__new__(Foo)
+    g.__setstate__((3,))
+    assert g.a == 3
+    assert not hasattr(g, 'b')
+
+    g.__setstate__((4, 5, 6))
+    assert (g.a, g.b) == (4, 5)
@@ -1,7 +1,9 @@
+import sys
 from enum import Enum
+from weakref import WeakKeyDictionary
 
 try:  # python 3.5+
-    from typing import Union, Tuple, Type, Callable, Iterable
+    from typing import Union, Tuple, Type, Callable, Iterable, Dict, Any
 except ImportError:
     pass
 
@@ -11,6 +13,61 @@ except ImportError:
     from funcsigs import signature, Signature
 
 
+_SIGNATURES_CACHE = WeakKeyDictionary()
+_INIT_FIELDS_CACHE = WeakKeyDictionary()
+
+
+def get_signature(f  # type: Callable
+                  ):
+    # type: (...) -> Signature
+    """
+    Returns the signature of `f`, using a per-function cache so that the (expensive) introspection is done only once.
+    The cache holds weak references only, so it does not prevent the functions from being garbage-collected.
+    Callables that can not be weakly referenced (such as `object.__init__`) are simply not cached.
+
+    :param f:
+    :return:
+    """
+    try:
+        return _SIGNATURES_CACHE[f]
+    except KeyError:
+        s = _SIGNATURES_CACHE[f] = signature(f)
+        return s
+    except TypeError:
+        # not weak-referenceable
+        return signature(f)
+
+
+def compile_function(src,             # type: str
+                     fun_name,        # type: str
+                     filename,        # type: str
+                     namespace=None,  # type: Dict[str, Any]
+                     qualname=None    # type: str
+                     ):
+    # type: (...) -> Callable
+    """
+    Compiles and executes the python source `src` and returns the function named `fun_name` that it defines. This is
+    used to generate methods specialized for a given list of field names, with the names baked into the bytecode.
+
+    The generated function looks as if it was defined in the calling function: its `__module__` is the module of the
+    caller, and its `__qualname__` is `<caller>.<locals>.<fun_name>` unless `qualname` is provided.
+
+    :param src: the source code defining the function
+    :param fun_name: the name of the function to return
+    :param filename: a pseudo file name for the generated code, appearing in tracebacks.
+    :param namespace: an optional dictionary of global names available to the generated function
+    :param qualname: an optional qualified name for the generated function
+    :return:
+    """
+    caller_frame = sys._getframe(1)
+    namespace = dict() if namespace is None else dict(namespace)
+    namespace['__name__'] = caller_frame.f_globals['__name__']
+    exec(compile(src, filename, 'exec'), namespace)
+    f = namespace[fun_name]
+    f.__qualname__ = qualname if qualname is not None else '%s.<locals>.%s' % (caller_frame.f_code.co_name, fun_name)
+    return f
+
+
 class DuplicateOverrideError(Exception):
     """ This is raised whenever a function is declared as overridden twice"""
 
@@ -128,12 +185,36 @@ def read_fields_from_init(init_fun,
     :param caller:
     :return: a tuple (selected_names, init_fun_sig)
     """
-    # get signature and all of its parameters
-    init_fun_sig = signature(init_fun)
-    all_names = tuple(n for n in init_fun_sig.parameters.keys() if n != 'self')
+    # get signature
+    init_fun_sig = get_signature(init_fun)
+
+    # the selected names are cached for each init function and (include, exclude), since they are immutable tuples.
+    # This is useful when several decorators are stacked on the same class.
+    try:
+        fields_cache = _INIT_FIELDS_CACHE[init_fun]
+    except KeyError:
+        fields_cache = _INIT_FIELDS_CACHE[init_fun] = dict()
+    except TypeError:
+        fields_cache = dict()  # not weak-referenceable: no cache
+
+    key = (include, exclude)
+    try:
+        return fields_cache[key], init_fun_sig
+    except KeyError:
+        pass
+    except TypeError:
+        key = None  # include or exclude is not hashable (e.g. a list): do not cache
+
+    # all of its parameters (except 'self')
+    try:
+        all_names = fields_cache[(None, None)]
+    except KeyError:
+        all_names = fields_cache[(None, None)] = tuple(n for n in init_fun_sig.parameters if n != 'self')
 
     # filter the names
     selected_names = filter_names(all_names, include=include, exclude=exclude, caller=caller)
+    if key is not None:
+        fields_cache[key] = selected_names
 
     return selected_names, init_fun_sig
 
@@ -194,7 +275,7 @@ def is_attr_selected(attr_name,     # type: str
     # check_var(include, var_name='include', var_types=[str, tuple], enforce_not_none=False)
     # check_var(exclude, var_name='exclude', var_types=[str, tuple], enforce_not_none=False)
 
-    if attr_name is 'self':
+    if attr_name == 'self':
         return False
     if exclude and attr_name in exclude:
         return False
@@ -204,6 +285,41 @@ def is_attr_selected(attr_name,     # type: str
         return False
 
 
+def make_attr_selector(include=None,             # type: Union[str, Tuple[str]]
+                       exclude=None,             # type: Union[str, Tuple[str]]
+                       private_name_prefix=None  # type: str
+                       ):
+    # type: (...) -> Callable[[str], bool]
+    """
+    Returns a function deciding whether an attribute is selected or not based on its name, like `is_attr_selected`,
+    and additionally excluding the names starting with `private_name_prefix` if it is not None. The arguments are
+    validated and include/exclude are converted to sets once, so this is the preferred way to filter many names.
+    Note: as in `is_attr_selected`, a string include/exclude is used as is, so names are matched as substrings of it.
+
+    :param include: a tuple of explicit attribute names to include (None means all)
+    :param exclude: a tuple of explicit attribute names to exclude. In such case, include should be None.
+    :param private_name_prefix: if not None, names starting with this prefix are not selected
+    :return:
+    """
+    if include is not None and exclude is not None:
+        raise ValueError('Only one of \'include\' or \'exclude\' argument should be provided.')
+
+    include_set = (include if isinstance(include, str) else frozenset(include)) if include else None
+    exclude_set = (exclude if isinstance(exclude, str) else frozenset(exclude)) if exclude else None
+    # a slice comparison is cheaper than a call to `str.startswith`
+    prefix_len = len(private_name_prefix) if private_name_prefix is not None else 0
+
+    def is_selected(attr_name  # type: str
+                    ):
+        # type: (...) -> bool
+        return attr_name != 'self' \
+            and (exclude_set is None or attr_name not in exclude_set) \
+            and (include_set is None or attr_name in include_set) \
+            and (private_name_prefix is None or attr_name[:prefix_len] != private_name_prefix)
+
+    return is_selected
+
+
 def get_constructor(cls  # type: Type
                     ):
     # type: (...) -> Tuple[Callable, bool]
@@ -234,6 +350,10 @@ def check_known_decorators(cls,
     If so, it raises an Exception
     :return:
     """
+    if 'enforce' not in sys.modules:
+        # the `__enforcer__` attribute is only ever set by the `enforce` library: no need to scan the class members
+        return
+
     for member in cls.__dict__.values():
         if hasattr(member, '__enforcer__'):
             raise AutoclassDecorationException('It seems that @runtime_validation decorator was applied to type <%s> '